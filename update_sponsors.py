@@ -4,18 +4,22 @@
 从爱发电 API 获取赞助者和订单信息,生成 Markdown 格式的赞助者列表并更新到 README 文件中。
 同时生成 JSON 格式的数据文件供其他应用使用。
 """
+import asyncio
+import functools
 import hashlib
-import json
 import logging
+import operator
 import os
 import random
 import time
+from collections.abc import Hashable
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
-import requests
+import aiohttp
+import orjson
 
 # ==================== 配置常量 ====================
 @dataclass(frozen=True)
@@ -43,6 +47,11 @@ class Config:
     MAX_RETRIES: int = 3
     BACKOFF_BASE: float = 0.8
     PAGE_SIZE: int = 50
+    MAX_CONCURRENCY: int = 10
+    POOL_SIZE: int = 20
+    KEEPALIVE_TIMEOUT: float = 30.0
+    # 首页订单中自带昵称和头像的比例达到该值时,跳过抓取赞助者列表
+    ORDER_USER_COVERAGE: float = 0.95
 
 
 config = Config()
@@ -58,266 +67,349 @@ logger = logging.getLogger(__name__)
 
 # ==================== API 客户端 ====================
 class AfdianAPIClient:
-    """爱发电 API 客户端"""
+    """爱发电 API 客户端(异步),首页之后的分页并发抓取
+
+    需在 ``async with`` 中使用,以便在事件循环内创建并关闭连接池。
+    """
+
+    # 与 json.dumps(..., separators=(",", ":")) 的输出逐字节一致
+    _PARAMS_TMPL = '{"page":%d,"per_page":%d}'
+    _HEADERS = {"Content-Type": "application/json"}
 
     def __init__(self, user_id: str, token: str):
         self.user_id = user_id
         self.token = token
-        self.session = requests.Session()
+        # 签名中的固定片段预先编码,避免每页拼接整串再编码
+        self._sign_prefix = token.encode("utf-8") + b"params"
+        self._sign_suffix = b"user_id" + user_id.encode("utf-8")
+        # 每个客户端独立的随机数生成器,用于重试退避抖动
+        self._rng = random.Random(os.urandom(8))
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(config.MAX_CONCURRENCY)
 
     def _make_sign(self, params_str: str, ts: int) -> str:
-        """生成 API 签名"""
-        raw = f"{self.token}params{params_str}ts{ts}user_id{self.user_id}"
-        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+        """生成 API 签名: md5(token + "params" + params + "ts" + ts + "user_id" + user_id)"""
+        h = hashlib.md5(self._sign_prefix)
+        h.update(params_str.encode("utf-8"))
+        h.update(b"ts%d" % ts)
+        h.update(self._sign_suffix)
+        return h.hexdigest()
+
+    def _build_payload(self, page: int, per_page: int) -> bytes:
+        """构造带签名的请求体,直接序列化为 JSON 字节"""
+        params_str = self._PARAMS_TMPL % (page, per_page)
+        ts = int(time.time())
+        sign = self._make_sign(params_str, ts)
+
+        return orjson.dumps({
+            "user_id": self.user_id,
+            "params": params_str,
+            "ts": ts,
+            "sign": sign
+        })
+
+    def _backoff(self, attempt: int) -> float:
+        """计算第 attempt 次失败后的等待时间"""
+        return (config.BACKOFF_BASE ** attempt) + self._rng.random() * 0.5
+
+    @staticmethod
+    def _check_response(data: Any, page: int) -> Optional[dict[str, Any]]:
+        """校验接口返回,失败时返回 None;通过校验的结果保证 data 字段为对象"""
+        if not isinstance(data, dict):
+            logger.error(f"第 {page} 页返回非 JSON 结构")
+            return None
+
+        if data.get("ec") != 200:
+            logger.error(
+                f"第 {page} 页接口返回错误: ec={data.get('ec')}, "
+                f"em={data.get('em')}"
+            )
+            return None
+
+        if not isinstance(data.get("data"), dict):
+            logger.error(f"第 {page} 页 data 不是对象")
+            return None
 
-    def _post_with_retry(self, url: str, payload: dict[str, Any]) -> dict[str, Any]:
+        return data
+
+    @staticmethod
+    def _extract_items(data: dict[str, Any], page: int) -> Optional[list[dict[str, Any]]]:
+        """提取单页记录列表,结构异常时返回 None"""
+        items = data["data"].get("list", [])
+        if not isinstance(items, list):
+            logger.warning(f"第 {page} 页 list 不是数组")
+            return None
+
+        logger.info(f"第 {page} 页获取 {len(items)} 条记录")
+        return items
+
+    @staticmethod
+    def _last_page(first: dict[str, Any]) -> int:
+        """根据第 1 页返回的 total_page 确定需要抓取的最后一页"""
+        total_page = first["data"].get("total_page")
+        if not isinstance(total_page, int) or total_page < 1:
+            return 1
+        return min(total_page, config.MAX_PAGES)
+
+
+    async def __aenter__(self) -> "AfdianAPIClient":
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=config.POOL_SIZE,
+                keepalive_timeout=config.KEEPALIVE_TIMEOUT
+            ),
+            timeout=aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT),
+            headers=self._HEADERS
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _post_with_retry(self, url: str, payload: bytes) -> dict[str, Any]:
         """带重试机制的 POST 请求"""
         for attempt in range(1, config.MAX_RETRIES + 1):
             try:
-                response = self.session.post(
-                    url,
-                    json=payload,
-                    timeout=config.REQUEST_TIMEOUT
-                )
-                response.raise_for_status()
-                return response.json()
+                async with self.session.post(url, data=payload) as response:
+                    response.raise_for_status()
+                    return orjson.loads(await response.read())
             except Exception as e:
                 if attempt == config.MAX_RETRIES:
                     raise
-                wait = (config.BACKOFF_BASE ** attempt) + random.random() * 0.5
+                wait = self._backoff(attempt)
                 logger.warning(
                     f"请求失败(尝试 {attempt}/{config.MAX_RETRIES}): {e}, "
                     f"等待 {wait:.2f}s 后重试"
                 )
-                time.sleep(wait)
+                await asyncio.sleep(wait)
 
         raise RuntimeError("Unexpected control flow")
 
-    def _fetch_page(self, api_url: str, page: int, per_page: int) -> Optional[dict[str, Any]]:
-        """获取单页数据"""
-        params = {"page": page, "per_page": per_page}
-        params_str = json.dumps(params, separators=(",", ":"), ensure_ascii=False)
-        ts = int(time.time())
-        sign = self._make_sign(params_str, ts)
-
-        payload = {
-            "user_id": self.user_id,
-            "params": params_str,
-            "ts": ts,
-            "sign": sign
-        }
-
-        try:
-            data = self._post_with_retry(api_url, payload)
-
-            if not isinstance(data, dict):
-                logger.error(f"第 {page} 页返回非 JSON 结构")
-                return None
+    async def _fetch_page(self, api_url: str, page: int, per_page: int) -> Optional[dict[str, Any]]:
+        """获取单页数据,并发数受信号量限制"""
+        async with self._semaphore:
+            payload = self._build_payload(page, per_page)
 
-            if data.get("ec") != 200:
-                logger.error(
-                    f"第 {page} 页接口返回错误: ec={data.get('ec')}, "
-                    f"em={data.get('em')}"
-                )
+            try:
+                data = await self._post_with_retry(api_url, payload)
+                return self._check_response(data, page)
+            except Exception as e:
+                logger.error(f"第 {page} 页请求失败: {e}")
                 return None
 
-            return data
-        except Exception as e:
-            logger.error(f"第 {page} 页请求失败: {e}")
-            return None
-
-    def fetch_all_pages(self, api_url: str) -> list[dict[str, Any]]:
-        """获取所有分页数据"""
-        all_items = []
-        page = 1
-
-        while page <= config.MAX_PAGES:
-            data = self._fetch_page(api_url, page, config.PAGE_SIZE)
-
-            if not data:
-                break
+    async def fetch_first_page(self, api_url: str) -> Optional[dict[str, Any]]:
+        """获取第 1 页数据"""
+        return await self._fetch_page(api_url, 1, config.PAGE_SIZE)
 
-            items = data.get("data", {}).get("list", [])
-            if not isinstance(items, list):
-                logger.warning(f"第 {page} 页 list 不是数组")
-                break
+    async def fetch_all_pages(
+            self, api_url: str, first: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        """获取所有分页数据:先取第 1 页得到 total_page,再并发抓取其余页
 
-            logger.info(f"第 {page} 页获取 {len(items)} 条记录")
-            all_items.extend(items)
+        若已通过 fetch_first_page 取得第 1 页,可传入 first 避免重复请求。
+        """
+        if first is None:
+            first = await self.fetch_first_page(api_url)
+        if not first:
+            return []
 
-            total_page = data.get("data", {}).get("total_page")
-            if total_page and page >= total_page:
-                break
+        all_items = self._extract_items(first, 1)
+        if not all_items:
+            return []
 
-            if not items:
-                break
+        pages = await asyncio.gather(*(
+            self._fetch_page(api_url, page, config.PAGE_SIZE)
+            for page in range(2, self._last_page(first) + 1)
+        ))
 
-            page += 1
+        for page, data in enumerate(pages, start=2):
+            if not data:
+                continue
+            items = self._extract_items(data, page)
+            if items:
+                all_items.extend(items)
 
         return all_items
 
-    def fetch_sponsors(self) -> list[dict[str, Any]]:
+    async def fetch_sponsors(self) -> list[dict[str, Any]]:
         """获取所有赞助者"""
         logger.info("开始抓取赞助者列表")
-        return self.fetch_all_pages(config.SPONSOR_API)
+        return await self.fetch_all_pages(config.SPONSOR_API)
 
-    def fetch_orders(self) -> list[dict[str, Any]]:
+    async def fetch_orders(
+            self, first: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
         """获取所有订单"""
         logger.info("开始抓取订单列表")
-        return self.fetch_all_pages(config.ORDER_API)
+        return await self.fetch_all_pages(config.ORDER_API, first)
+
+
+# 手写的 params 模板必须与标准 JSON 序列化结果一致,否则签名校验会失败
+assert (
+    AfdianAPIClient._PARAMS_TMPL % (1, config.PAGE_SIZE)
+    == orjson.dumps({"page": 1, "per_page": config.PAGE_SIZE}).decode()
+)
 
 
 # ==================== 数据处理 ====================
+# 头像单元格模板,尺寸在模块加载时固定
+_AVATAR_CELL_TMPL = f'<img src="%s" width="{config.AVATAR_SIZE}">'
+
+# 更新时间行前缀,比较 README 内容时忽略该行
+_UPDATE_TIME_PREFIX = "> 更新时间: "
+
+# Markdown 列表固定表头,每次只需填入更新时间
+_MD_HEADER = (
+    "## ❤️ 赞助者列表\n\n"
+    + _UPDATE_TIME_PREFIX
+    + (
+        "{update_time} (UTC+8) 每4小时更新一次\n"
+        "\n"
+        "| 头像 | 昵称 |\n"
+        "|------|------|"
+    )
+)
+
+# 会破坏 Markdown 表格的字符替换表
+_MD_TRANS = str.maketrans({"\n": " ", "|": "&#124;"})
+
+# 北京时间相对 UTC 的偏移秒数
+_BEIJING_OFFSET = int(config.BEIJING_TZ.utcoffset(None).total_seconds())
+
+# 可格式化的最大时间戳(北京时间 9999-12-31 23:59:59),超出视为无效
+_MAX_TIMESTAMP = 253402300799 - _BEIJING_OFFSET
+
+# user_map 未命中时的共享空映射,只读
+_EMPTY: dict[str, str] = {}
+
+
 class SponsorDataProcessor:
     """赞助者数据处理器"""
 
     def __init__(self, sponsors: list[dict[str, Any]], orders: list[dict[str, Any]]):
         self.sponsors = sponsors
-        self.orders = orders
+        self.orders = self._filter_orders(orders)
         self.user_map = self._build_user_map()
+        # 按时间倒序排好的 (时间戳, 订单),只排序一次,时间戳只解析一次
+        self._sorted_orders = sorted(
+            ((self._get_order_timestamp(order), order) for order in self.orders),
+            key=operator.itemgetter(0),
+            reverse=True
+        )
+
+    @staticmethod
+    def _filter_orders(orders: list[Any]) -> list[dict[str, Any]]:
+        """过滤掉结构异常的订单,保证后续逐行生成无需异常处理"""
+        valid = [
+            order for order in orders
+            if isinstance(order, dict) and isinstance(order.get("user_id"), Hashable)
+        ]
+        skipped = len(orders) - len(valid)
+        if skipped:
+            logger.info(f"共跳过 {skipped} 条无法处理的订单")
+        return valid
 
     def _build_user_map(self) -> dict[str, dict[str, str]]:
         """构建用户 ID 到用户信息的映射"""
-        user_map = {}
-        for sponsor in self.sponsors:
-            try:
-                user = sponsor.get("user", {})
-                user_id = user.get("user_id")
-                if user_id:
-                    user_map[user_id] = {
-                        "name": user.get("name") or "-",
-                        "avatar": user.get("avatar") or "",
-                    }
-            except Exception as e:
-                logger.warning(f"处理赞助者项异常: {e}")
-        return user_map
+        return {
+            user["user_id"]: {
+                "name": user.get("name") or "-",
+                "avatar": user.get("avatar") or "",
+            }
+            for sponsor in self.sponsors
+            if isinstance(sponsor, dict)
+            and isinstance(user := sponsor.get("user"), dict)
+            and user.get("user_id")
+            and isinstance(user["user_id"], Hashable)
+        }
+
+    @staticmethod
+    def orders_have_user_info(orders: Any) -> bool:
+        """判断订单是否普遍自带昵称和头像,从而无需赞助者列表补全"""
+        if not isinstance(orders, list) or not orders:
+            return False
+        covered = sum(
+            1 for order in orders
+            if isinstance(order, dict) and order.get("user_name") and order.get("avatar")
+        )
+        return covered >= len(orders) * config.ORDER_USER_COVERAGE
 
     @staticmethod
     def _safe_text(value: Any) -> str:
         """清理文本,避免破坏 Markdown 表格"""
         if value is None:
             return "-"
-        text = str(value).replace("\n", " ").strip()
-        text = text.replace("|", "&#124;")
+        text = str(value).translate(_MD_TRANS).strip()
         return text if text else "-"
 
     @staticmethod
     def _get_order_timestamp(order: dict[str, Any]) -> int:
-        """获取订单时间戳"""
+        """获取订单时间戳,无效或超出可格式化范围时返回 0"""
         try:
-            return int(order.get("last_pay_time") or order.get("create_time") or 0)
+            timestamp = int(order.get("last_pay_time") or order.get("create_time") or 0)
         except Exception:
             return 0
+        return timestamp if 0 <= timestamp <= _MAX_TIMESTAMP else 0
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _format_timestamp(timestamp: int) -> str:
         """格式化时间戳为北京时间"""
         if not timestamp:
             return "-"
-        dt = datetime.fromtimestamp(timestamp, config.BEIJING_TZ)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-
-    def _generate_table_row(self, order: dict[str, Any]) -> Optional[str]:
-        """生成表格行(仅包含头像和昵称)"""
-        try:
-            user_id = order.get("user_id")
-            user_info = self.user_map.get(user_id, {})
+        t = time.gmtime(timestamp + _BEIJING_OFFSET)
+        return "%04d-%02d-%02d %02d:%02d:%02d" % (
+            t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec
+        )
 
-            name = self._safe_text(
-                user_info.get("name") or order.get("user_name") or "-"
-            )
-            avatar = user_info.get("avatar") or order.get("avatar") or ""
+    def generate_all(self) -> tuple[str, dict[str, Any], list[dict[str, Any]]]:
+        """单次遍历订单,同时生成 Markdown 列表和 JSON 数据(仅包含头像和昵称)
 
-            avatar_cell = (
-                f'<img src="{avatar}" width="{config.AVATAR_SIZE}">'
-                if avatar else "-"
-            )
+        返回 (Markdown 文本, JSON 元信息, 赞助者条目列表)。
+        """
+        now = datetime.now(config.BEIJING_TZ)
+        update_time = now.strftime("%Y-%m-%d %H:%M:%S")
 
-            return f"| {avatar_cell} | {name} |"
-        except Exception as e:
-            logger.warning(f"处理订单行时异常: {e}")
-            return None
+        lines = [_MD_HEADER.format(update_time=update_time)]
+        sponsors_list = []
+        get_user = self.user_map.get
+        safe_text = self._safe_text
+        format_timestamp = self._format_timestamp
 
-    def _generate_sponsor_item(self, order: dict[str, Any]) -> Optional[dict[str, Any]]:
-        """生成 JSON 格式的赞助者条目(仅包含头像和昵称)"""
-        try:
+        for timestamp, order in self._sorted_orders:
             user_id = order.get("user_id")
-            user_info = self.user_map.get(user_id, {})
+            user_info = get_user(user_id, _EMPTY)
 
-            name = user_info.get("name") or order.get("user_name") or "匿名"
+            name = user_info.get("name") or order.get("user_name")
             avatar = user_info.get("avatar") or order.get("avatar") or ""
-            timestamp = self._get_order_timestamp(order)
 
-            return {
+            avatar_cell = _AVATAR_CELL_TMPL % avatar if avatar else "-"
+            lines.append(f"| {avatar_cell} | {safe_text(name or '-')} |")
+
+            sponsors_list.append({
                 "user_id": user_id,
-                "name": name,
+                "name": name or "匿名",
                 "avatar": avatar,
                 "timestamp": timestamp,
-                "time": self._format_timestamp(timestamp)
-            }
-        except Exception as e:
-            logger.warning(f"生成 JSON 条目时异常: {e}")
-            return None
-
-    def generate_markdown(self) -> str:
-        """生成 Markdown 格式的赞助者列表(仅包含头像和昵称)"""
-        sorted_orders = sorted(
-            self.orders,
-            key=self._get_order_timestamp,
-            reverse=True
-        )
-
-        now = datetime.now(config.BEIJING_TZ)
-        update_time = now.strftime("%Y-%m-%d %H:%M:%S")
-
-        lines = [
-            "## ❤️ 赞助者列表",
-            "",
-            f"> 更新时间: {update_time} (UTC+8) 每4小时更新一次",
-            "",
-            "| 头像 | 昵称 |",
-            "|------|------|",
-        ]
-
-        skipped = 0
-        for order in sorted_orders:
-            row = self._generate_table_row(order)
-            if row:
-                lines.append(row)
-            else:
-                skipped += 1
-
-        if skipped:
-            logger.info(f"共跳过 {skipped} 条无法处理的订单")
-
-        return "\n".join(lines)
+                "time": format_timestamp(timestamp)
+            })
 
-    def generate_json_data(self) -> dict[str, Any]:
-        """生成 JSON 格式的赞助者数据(仅包含头像和昵称)"""
-        sorted_orders = sorted(
-            self.orders,
-            key=self._get_order_timestamp,
-            reverse=True
-        )
-
-        now = datetime.now(config.BEIJING_TZ)
-        update_time = now.strftime("%Y-%m-%d %H:%M:%S")
-
-        sponsors_list = []
-        for order in sorted_orders:
-            item = self._generate_sponsor_item(order)
-            if item:
-                sponsors_list.append(item)
-
-        return {
+        meta = {
             "update_time": update_time,
             "update_timestamp": int(now.timestamp()),
             "total_count": len(sponsors_list),
-            "sponsors": sponsors_list
         }
+        return "\n".join(lines), meta, sponsors_list
 
 
 # ==================== README 更新 ====================
+# 标记区块的固定前后缀
+_BLOCK_PREFIX = f"{config.MARKER_START}\n"
+_BLOCK_SUFFIX = f"\n{config.MARKER_END}"
+
+
 class ReadmeUpdater:
     """README 文件更新器"""
 
@@ -332,33 +424,43 @@ class ReadmeUpdater:
 
         text = self.filepath.read_text(encoding="utf-8")
 
-        if config.MARKER_START not in text or config.MARKER_END not in text:
+        start = text.find(config.MARKER_START)
+        end = text.find(config.MARKER_END, start) if start != -1 else -1
+        if end == -1:
             self._append_markers(text, content)
             return
 
-        self._replace_content(text, content)
+        self._replace_content(text, content, start, end + len(config.MARKER_END))
 
     def _create_new_file(self, content: str) -> None:
         """创建新的 README 文件"""
         logger.warning(f"{self.filepath} 不存在,创建新文件")
-        new_content = f"{config.MARKER_START}\n{content}\n{config.MARKER_END}\n"
+        new_content = _BLOCK_PREFIX + content + _BLOCK_SUFFIX + "\n"
         self.filepath.write_text(new_content, encoding="utf-8")
 
     def _append_markers(self, text: str, content: str) -> None:
         """在文件末尾追加标记区块"""
         logger.warning(f"{self.filepath} 中未找到占位标记,自动追加")
-        new_text = (
-                text.rstrip() +
-                f"\n\n{config.MARKER_START}\n{content}\n{config.MARKER_END}\n"
-        )
+        new_text = text.rstrip() + "\n\n" + _BLOCK_PREFIX + content + _BLOCK_SUFFIX + "\n"
         self.filepath.write_text(new_text, encoding="utf-8")
 
-    def _replace_content(self, text: str, content: str) -> None:
-        """替换标记区块中的内容"""
-        before = text.split(config.MARKER_START)[0]
-        after = text.split(config.MARKER_END)[1]
-        new_block = f"{config.MARKER_START}\n{content}\n{config.MARKER_END}"
-        self.filepath.write_text(before + new_block + after, encoding="utf-8")
+    @staticmethod
+    def _without_update_time(block: str) -> list[str]:
+        """去掉更新时间行,用于比较区块内容是否变化"""
+        return [
+            line for line in block.split("\n")
+            if not line.startswith(_UPDATE_TIME_PREFIX)
+        ]
+
+    def _replace_content(self, text: str, content: str, start: int, end: int) -> None:
+        """替换 text[start:end] 处的标记区块,内容未变化(忽略更新时间)时跳过写入"""
+        new_block = _BLOCK_PREFIX + content + _BLOCK_SUFFIX
+        if self._without_update_time(text[start:end]) == self._without_update_time(new_block):
+            logger.info(f"{self.filepath} 中的赞助者列表未变化,跳过写入")
+            return
+
+        new_text = text[:start] + new_block + text[end:]
+        self.filepath.write_bytes(new_text.encode("utf-8"))
         logger.info(f"已更新 {self.filepath} 中的标记区块")
 
 
@@ -366,47 +468,84 @@ class ReadmeUpdater:
 class JsonExporter:
     """JSON 数据导出器"""
 
+    _OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    # 赞助者条目位于第二层缩进
+    _ITEM_INDENT = b"\n    "
+
     def __init__(self, filepath: str):
         self.filepath = Path(filepath)
 
-    def export(self, data: dict[str, Any]) -> None:
-        """导出 JSON 数据到文件"""
+    def has_same_sponsors(self, sponsors: list[dict[str, Any]]) -> bool:
+        """判断现有文件中的赞助者条目是否与 sponsors 完全相同(忽略更新时间)"""
         try:
-            self.filepath.write_text(
-                json.dumps(data, ensure_ascii=False, indent=2),
-                encoding="utf-8"
-            )
+            existing = orjson.loads(self.filepath.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return False
+        return isinstance(existing, dict) and existing.get("sponsors") == sponsors
+
+    def export(self, meta: dict[str, Any], sponsors: Iterable[dict[str, Any]]) -> None:
+        """导出 JSON 数据到文件
+
+        逐条序列化 sponsors 并写入同目录下的临时文件,完成后再替换目标文件,
+        中途失败不会留下截断的 JSON;输出与
+        orjson.dumps({**meta, "sponsors": [...]}, OPT_INDENT_2) 一致。
+        """
+        tmp_path = self.filepath.with_name(self.filepath.name + ".tmp")
+        try:
+            # 以空数组序列化元信息,截掉末尾的 "[]\n}" 后接续写入数组内容
+            head = orjson.dumps({**meta, "sponsors": []}, option=self._OPTIONS)
+            with tmp_path.open("wb") as f:
+                f.write(head[:-4])
+                f.write(b"[")
+                separator = b""
+                for item in sponsors:
+                    f.write(separator)
+                    f.write(self._ITEM_INDENT)
+                    f.write(
+                        orjson.dumps(item, option=self._OPTIONS)
+                        .replace(b"\n", self._ITEM_INDENT)
+                    )
+                    separator = b","
+                f.write(b"\n  ]\n}" if separator else b"]\n}")
+            os.replace(tmp_path, self.filepath)
             logger.info(f"已生成 JSON 文件: {self.filepath}")
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             logger.error(f"生成 JSON 文件失败: {e}")
             raise
 
 
 # ==================== 主函数 ====================
-def main() -> None:
+async def amain() -> None:
     """主函数"""
     # 验证配置
     if not config.USER_ID or not config.TOKEN:
         logger.error("请先设置环境变量 AFDIAN_USER_ID 和 AFDIAN_TOKEN")
         return
 
-    # 初始化 API 客户端
-    client = AfdianAPIClient(config.USER_ID, config.TOKEN)
+    # 初始化 API 客户端并获取数据
+    async with AfdianAPIClient(config.USER_ID, config.TOKEN) as client:
+        # 先取第 1 页订单,若订单已自带昵称和头像则不必抓取赞助者列表
+        first_orders = await client.fetch_first_page(config.ORDER_API)
+        sample = first_orders["data"].get("list") if first_orders else None
 
-    # 获取数据
-    try:
-        sponsors = client.fetch_sponsors()
-        logger.info(f"抓取到 {len(sponsors)} 个赞助者记录")
-    except Exception as e:
-        logger.error(f"抓取赞助者时发生错误: {e}")
-        sponsors = []
+        if SponsorDataProcessor.orders_have_user_info(sample):
+            logger.info("订单已包含昵称和头像,跳过抓取赞助者列表")
+            sponsors = []
+        else:
+            try:
+                sponsors = await client.fetch_sponsors()
+                logger.info(f"抓取到 {len(sponsors)} 个赞助者记录")
+            except Exception as e:
+                logger.error(f"抓取赞助者时发生错误: {e}")
+                sponsors = []
 
-    try:
-        orders = client.fetch_orders()
-        logger.info(f"抓取到 {len(orders)} 条订单记录")
-    except Exception as e:
-        logger.error(f"抓取订单时发生错误: {e}")
-        return
+        try:
+            orders = await client.fetch_orders(first_orders)
+            logger.info(f"抓取到 {len(orders)} 条订单记录")
+        except Exception as e:
+            logger.error(f"抓取订单时发生错误: {e}")
+            return
 
     if not orders:
         logger.error("没有订单数据,无法生成列表")
@@ -414,27 +553,31 @@ def main() -> None:
 
     # 处理数据并生成 Markdown 和 JSON
     processor = SponsorDataProcessor(sponsors, orders)
+    markdown, json_meta, sponsors_list = processor.generate_all()
 
-    # 生成 Markdown
-    markdown = processor.generate_markdown()
-
-    # 更新 README
+    # 更新 README(列表未变化时由 ReadmeUpdater 跳过写入)
     try:
         updater = ReadmeUpdater(config.README_FILE)
         updater.update(markdown)
-        logger.info(f"已更新 README 文件")
     except Exception as e:
         logger.error(f"更新 README 失败: {e}")
 
-    # 生成 JSON 文件
+    # 生成 JSON 文件,赞助者数据未变化时跳过,避免仅因更新时间变化而产生提交
     try:
-        json_data = processor.generate_json_data()
         exporter = JsonExporter(config.JSON_FILE)
-        exporter.export(json_data)
+        if exporter.has_same_sponsors(sponsors_list):
+            logger.info(f"{exporter.filepath} 中的赞助者数据未变化,跳过写入")
+        else:
+            exporter.export(json_meta, sponsors_list)
         logger.info(f"脚本完成,共处理 {len(orders)} 条订单")
     except Exception as e:
         logger.error(f"生成 JSON 文件失败: {e}")
 
 
+def main() -> None:
+    """同步入口"""
+    asyncio.run(amain())
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file